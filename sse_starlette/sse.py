@@ -229,19 +229,21 @@ class EventSourceResponse(Response):
         """
         async with anyio.create_task_group() as task_group:
             # https://trio.readthedocs.io/en/latest/reference-core.html#custom-supervisors
-            async def cancel_on_finish(coro: Callable[[], Awaitable[None]]):
-                await coro()
+            async def cancel_on_finish(
+                func: Callable[..., Awaitable[None]], *args: Any
+            ) -> None:
+                await func(*args)
                 task_group.cancel_scope.cancel()
 
-            task_group.start_soon(cancel_on_finish, lambda: self._stream_response(send))
-            task_group.start_soon(cancel_on_finish, lambda: self._ping(send))
+            task_group.start_soon(cancel_on_finish, self._stream_response, send)
+            task_group.start_soon(cancel_on_finish, self._ping, send)
             task_group.start_soon(cancel_on_finish, self._listen_for_exit_signal)
 
             if self.data_sender_callable:
                 task_group.start_soon(self.data_sender_callable)
 
             # Wait for the client to disconnect last
-            await cancel_on_finish(lambda: self._listen_for_disconnect(receive))
+            await cancel_on_finish(self._listen_for_disconnect, receive)
 
         if self.background is not None:
             await self.background()
@@ -49,11 +49,10 @@ async def app():
                 while True:  # i <= 20:
                     # yield dict(id=..., event=..., data=...)
                     i += 1
-                    print(f"Sending {i}")
                     yield dict(data=i)
                     await asyncio.sleep(0.3)
             except asyncio.CancelledError as e:
-                _log.info(f"Disconnected from client (via refresh/close) {req.client}")
+                _log.info("Disconnected from client (via refresh/close) %s", req.client)
                 # Do any other cleanup, if any
                 raise e
 
@@ -91,5 +90,5 @@ async def httpx_client(reset_appstatus_event, app):
 @pytest.fixture
 def client(reset_appstatus_event, app):
     with TestClient(app=app, base_url="http://localhost:8000") as client:
-        print("Yielding Client")
+        _log.info("Yielding Client")
         yield client
@@ -120,7 +120,8 @@ async def server_context(app_path: str) -> AsyncIterator[ServerManager]:
 class SSEClient:
     """Client for consuming SSE streams"""
 
-    def __init__(self, url: str, expected_lines: int):
+    def __init__(self, client: httpx.AsyncClient, url: str, expected_lines: int):
+        self.client = client
         self.url = url
         self.expected_lines = expected_lines
         self.received_lines = 0
@@ -132,14 +133,13 @@ class SSEClient:
     async def connect_and_consume(self) -> None:
         """Connect to SSE stream and consume messages"""
         try:
-            async with httpx.AsyncClient() as client:
-                async with timeout(20):  # 20 second timeout for stream consumption
-                    async with client.stream("GET", self.url) as response:
-                        async for line in response.aiter_lines():
-                            if line.strip():  # Only count non-empty lines
-                                self.received_lines += 1
-                                if self.received_lines >= self.expected_lines:
-                                    break
+            async with timeout(20):  # 20 second timeout for stream consumption
+                async with self.client.stream("GET", self.url) as response:
+                    async for line in response.aiter_lines():
+                        if line.strip():  # Only count non-empty lines
+                            self.received_lines += 1
+                            if self.received_lines >= self.expected_lines:
+                                break
         except Exception as e:
             self.errors.append(e)
             raise
@@ -159,10 +159,10 @@ async def test_sse_multiple_consumers(
 ):
     """Test multiple consumers connecting to SSE endpoint"""
 
-    async with server_context(app_path) as server:
-        # Create and start consumers
+    async with server_context(app_path) as server, httpx.AsyncClient() as http_client:
+        # Create and start consumers, sharing one client and its connection pool
         clients = [
-            SSEClient(f"{server.url}/endless", expected_lines)
+            SSEClient(http_client, f"{server.url}/endless", expected_lines)
             for _ in range(num_consumers)
         ]
 
@@ -27,19 +27,18 @@ class SSEServerContainer(DockerContainer):
         self.with_exposed_ports(8000)
 
 
-async def consume_events(url: str, expected_lines: int = 2):
+async def consume_events(client: httpx.AsyncClient, url: str, expected_lines: int = 2):
     """Simulate Client: Stream the SSE endpoint and count received lines."""
     i = 0
-    async with httpx.AsyncClient() as client:
-        try:
-            async with client.stream("GET", url) as response:
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        _log.info(f"Received line: {line}")
-                        i += 1
-        except (httpx.RemoteProtocolError, httpx.ReadError) as e:
-            _log.error(f"Error during streaming: {str(e)}")
-            return i, str(e)
+    try:
+        async with client.stream("GET", url) as response:
+            async for line in response.aiter_lines():
+                if line.strip():
+                    _log.info(f"Received line: {line}")
+                    i += 1
+    except (httpx.RemoteProtocolError, httpx.ReadError) as e:
+        _log.error(f"Error during streaming: {str(e)}")
+        return i, str(e)
     return i, None
 
 
@@ -66,18 +65,20 @@ async def test_sse_server_termination(caplog, app_path, expected_lines):
         port = container.get_exposed_port(8000)
         url = f"http://localhost:{port}/endless"
 
-        # Create background tasks for consumers
-        tasks = [
-            asyncio.create_task(consume_events(url, expected_lines))
-            for _ in range(N_CONSUMERS)
-        ]
+        # All consumers share one client (and its connection pool)
+        async with httpx.AsyncClient() as client:
+            # Create background tasks for consumers
+            tasks = [
+                asyncio.create_task(consume_events(client, url, expected_lines))
+                for _ in range(N_CONSUMERS)
+            ]
 
-        # Wait a bit then kill the server
-        await asyncio.sleep(1)
-        container.stop(force=True)
+            # Wait a bit then kill the server
+            await asyncio.sleep(1)
+            container.stop(force=True)
 
-        # Now wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
+            # Now wait for all tasks to complete
+            results = await asyncio.gather(*tasks)
 
         # Check error count: one connection error per client
         error_count = sum(1 for _, error in results if error is not None)